@@ -1,6 +1,25 @@
 import pygame
+import heapq
 import math
-from queue import PriorityQueue
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, the search falls back to pure Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that returns the function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 # Setup window
 WIDTH = 800
@@ -17,21 +36,118 @@ PINK = (255, 0, 255)  # Start node
 BLUE = (0, 0, 128)  # End node
 GREY = (128, 128, 128)  # Grid lines
 
+# Color ids stored in the grid's color array. COLOR_TABLE maps each id to
+# its RGB color and is only needed when drawing.
+WHITE_ID = 0
+BLACK_ID = 1
+RED_ID = 2
+GREEN_ID = 3
+PURPLE_ID = 4
+PINK_ID = 5
+BLUE_ID = 6
+COLOR_TABLE = (WHITE, BLACK, RED, GREEN, PURPLE, PINK, BLUE)
+
+ROWS = 50
+
+# Score of cells not reached yet, small enough that adding a path cost to
+# it cannot overflow an int32
+INF_COST = 2**30
+
+# Number of node expansions between two redraws while searching
+DRAW_EVERY = 32
+# Number of path nodes colored between two redraws while tracing the path
+PATH_DRAW_EVERY = 8
+
+# Status codes returned by the JIT-compiled search
+SEARCH_RUNNING = 0
+SEARCH_FOUND = 1
+SEARCH_FAILED = 2
+
+
+@dataclass
+class GridState:
+    """
+    Per-cell grid data stored as parallel arrays indexed by the flat
+    cell id ``row * rows + col``.
+    """
+
+    rows: int
+    gap: int
+    color: np.ndarray  # uint8 color ids
+    drawn: np.ndarray  # uint8 color ids currently painted on the board
+    g: np.ndarray  # int32 cost from the start node, INF_COST if unreached
+    f: np.ndarray  # int32 estimated total cost through the node
+    came_from: np.ndarray  # int32 predecessor cell id, -1 if none
+    in_open: np.ndarray  # uint8 flag, 1 while the cell is in the open set
+    neighbours: np.ndarray  # int32 (N, 4) neighbour ids, -1 outside the grid
+    barrier_bits: np.ndarray  # uint64 (rows, words), bit col set for barriers
+    overlay: pygame.Surface  # grid lines for this grid size
+    nodes: list  # Node views, one per cell id
+
+    def node(self, row, col):
+        """
+        Returns the node at the given grid position.
+        """
+        return self.nodes[row * self.rows + col]
+
+    def invalidate(self):
+        """
+        Marks every cell as stale so the next draw repaints the whole grid.
+        """
+        self.drawn.fill(255)
+
+    def update_barrier_bits(self):
+        """
+        Packs the barrier cells of each row into barrier_bits, bit col of
+        word col // 64 being set when the cell at col is a barrier.
+        """
+        rows = self.rows
+        words = self.barrier_bits.shape[1]
+        barriers = np.zeros((rows, words * 64), np.uint8)
+        barriers[:, :rows] = (self.color == BLACK_ID).reshape(rows, rows)
+        packed = np.packbits(barriers, axis=1, bitorder="little")
+        self.barrier_bits[:] = packed.view("<u8")
+
+    def barrier_rows(self):
+        """
+        Returns the barrier bits of each row as a Python int, which is
+        cheaper to test than a NumPy word in the pure Python searches.
+        """
+        return [
+            int.from_bytes(words.astype("<u8").tobytes(), "little")
+            for words in self.barrier_bits
+        ]
+
+    def reset_search(self):
+        """
+        Clears the scores and predecessors of a previous search.
+        """
+        self.g.fill(INF_COST)
+        self.f.fill(INF_COST)
+        self.came_from.fill(-1)
+        self.in_open.fill(0)
+
 
 class Node:
     """
-    A class representing a single node in the grid.
+    A view of a single node in the grid.
     """
 
-    def __init__(self, row, col, width, total_rows):
+    def __init__(self, grid, row, col):
+        self.grid = grid
         self.row = row
         self.col = col
-        self.x = row * width
-        self.y = col * width
-        self.color = WHITE
-        self.neighbours = []
-        self.width = width
-        self.total_rows = total_rows
+        self.idx = row * grid.rows + col
+        self.x = row * grid.gap
+        self.y = col * grid.gap
+        self.width = grid.gap
+
+    @property
+    def color(self):
+        """
+        Returns the color id of the node.
+        """
+        return int(self.grid.color[self.idx])
 
     def get_pos(self):
         """
@@ -43,73 +159,73 @@ class Node:
         """
         Returns True if the node has been considered (closed).
         """
-        return self.color == RED
+        return self.grid.color[self.idx] == RED_ID
 
     def is_open(self):
         """
         Returns True if the node is open for consideration.
         """
-        return self.color == GREEN
+        return self.grid.color[self.idx] == GREEN_ID
 
     def is_barrier(self):
         """
         Returns True if the node is a barrier.
         """
-        return self.color == BLACK
+        return self.grid.color[self.idx] == BLACK_ID
 
     def is_start(self):
         """
         Returns True if the node is the start node.
         """
-        return self.color == PINK
+        return self.grid.color[self.idx] == PINK_ID
 
     def is_end(self):
         """
         Returns True if the node is the end node.
         """
-        return self.color == BLUE
+        return self.grid.color[self.idx] == BLUE_ID
 
     def reset(self):
         """
         Resets the node to its default color.
         """
-        self.color = WHITE
+        self.grid.color[self.idx] = WHITE_ID
 
     def make_start(self):
         """
         Sets the node color to the start color.
         """
-        self.color = PINK
+        self.grid.color[self.idx] = PINK_ID
 
     def make_closed(self):
         """
         Sets the node color to the closed color.
         """
-        self.color = RED
+        self.grid.color[self.idx] = RED_ID
 
     def make_open(self):
         """
         Sets the node color to the open color.
         """
-        self.color = GREEN
+        self.grid.color[self.idx] = GREEN_ID
 
     def make_barrier(self):
         """
         Sets the node color to the barrier color.
         """
-        self.color = BLACK
+        self.grid.color[self.idx] = BLACK_ID
 
     def make_end(self):
         """
         Sets the node color to the end color.
         """
-        self.color = BLUE
+        self.grid.color[self.idx] = BLUE_ID
 
     def make_path(self):
         """
         Sets the node color to the path color.
         """
-        self.color = PURPLE
+        self.grid.color[self.idx] = PURPLE_ID
 
     def draw(self, win):
         """
@@ -117,36 +233,7 @@ class Node:
         Args:
             win (pygame.Surface): The window to draw the node on.
         """
-        pygame.draw.rect(win, self.color, (self.x, self.y, self.width, self.width))
-
-    def update_neighbours(self, grid):
-        """
-        Updates the neighbors of the node.
-        Args:
-            grid (list): The grid containing all the nodes.
-        """
-        self.neighbours = []
-        # Moving down in the grid
-        if (
-            self.row < self.total_rows - 1
-            and not grid[self.row + 1][self.col].is_barrier()
-        ):
-            self.neighbours.append(grid[self.row + 1][self.col])
-        # Moving up in the grid
-        if self.row > 0 and not grid[self.row - 1][self.col].is_barrier():
-            self.neighbours.append(grid[self.row - 1][self.col])
-        # Moving right in the grid
-        if (
-            self.col < self.total_rows - 1
-            and not grid[self.row][self.col + 1].is_barrier()
-        ):
-            self.neighbours.append(grid[self.row][self.col + 1])
-        # Moving left in the grid
-        if self.col > 0 and not grid[self.row][self.col - 1].is_barrier():
-            self.neighbours.append(grid[self.row][self.col - 1])
-
-    def __lt__(self, other):
-        return False
+        win.fill(COLOR_TABLE[self.color], (self.x, self.y, self.width, self.width))
 
 
 def heuristic(p1, p2):
@@ -163,6 +250,25 @@ def heuristic(p1, p2):
     return abs(x1 - x2) + abs(y1 - y2)
 
 
+def create_neighbour_table(rows):
+    """
+    Builds the neighbour ids of every cell of a 4-connected grid.
+    Args:
+        rows (int): The number of rows and columns in the grid.
+    Returns:
+        np.ndarray: An (N, 4) int32 array of the cells below, above, right
+        and left of each cell, -1 where the move leaves the grid.
+    """
+    idx = np.arange(rows * rows, dtype=np.int32)
+    row, col = np.divmod(idx, rows)
+    neighbours = np.stack((idx + rows, idx - rows, idx + 1, idx - 1), axis=1)
+    neighbours[row == rows - 1, 0] = -1
+    neighbours[row == 0, 1] = -1
+    neighbours[col == rows - 1, 2] = -1
+    neighbours[col == 0, 3] = -1
+    return neighbours
+
+
 def create_grid(rows, width):
     """
     Creates a grid of nodes.
@@ -170,48 +276,75 @@ def create_grid(rows, width):
         rows (int): The number of rows and columns in the grid.
         width (int): The width of the window.
     Returns:
-        list: A 2D list representing the grid.
+        GridState: The arrays backing the grid, with a node view per cell.
     """
-    grid = []
-    gap = width // rows
-    for i in range(rows):
-        grid.append([])
-        for j in range(rows):
-            node = Node(i, j, gap, rows)
-            grid[i].append(node)
+    n = rows * rows
+    grid = GridState(
+        rows=rows,
+        gap=width // rows,
+        color=np.full(n, WHITE_ID, np.uint8),
+        # Nothing has been painted yet, so every cell is drawn on the first frame
+        drawn=np.full(n, 255, np.uint8),
+        g=np.full(n, INF_COST, np.int32),
+        f=np.full(n, INF_COST, np.int32),
+        came_from=np.full(n, -1, np.int32),
+        in_open=np.zeros(n, np.uint8),
+        neighbours=create_neighbour_table(rows),
+        barrier_bits=np.zeros((rows, (rows + 63) // 64), np.uint64),
+        overlay=create_grid_overlay(rows, width),
+        nodes=[],
+    )
+    grid.nodes = [Node(grid, i, j) for i in range(rows) for j in range(rows)]
     return grid
 
 
-def draw_grid(win, rows, width):
+def create_grid_overlay(rows, width):
     """
-    Draws grid lines on the window.
+    Renders the grid lines once onto a transparent surface.
     Args:
-        win (pygame.Surface): The window to draw on.
         rows (int): The number of rows and columns in the grid.
         width (int): The width of the window.
+    Returns:
+        pygame.Surface: A per-pixel alpha surface holding the grid lines.
     """
+    overlay = pygame.Surface((width, width), pygame.SRCALPHA)
     gap = width // rows
     for i in range(rows):
-        pygame.draw.line(win, GREY, (0, i * gap), (width, i * gap))
-        for j in range(rows):
-            pygame.draw.line(win, GREY, (j * gap, 0), (j * gap, width))
+        pygame.draw.line(overlay, GREY, (0, i * gap), (width, i * gap))
+        pygame.draw.line(overlay, GREY, (i * gap, 0), (i * gap, width))
+    return overlay
+
+
+def draw_grid(win, grid, area):
+    """
+    Draws grid lines on the window.
+    Args:
+        win (pygame.Surface): The window to draw on.
+        grid (GridState): The grid whose lines are drawn.
+        area (tuple): The (x, y, width, height) part of the grid to draw.
+    """
+    win.blit(grid.overlay, area, area)
 
 
-def draw(win, grid, rows, width):
+def draw(win, grid):
     """
     Draws the entire grid on the window.
+    Only nodes whose color changed since the last frame are repainted, and
+    only their rectangles are pushed to the display.
     Args:
         win (pygame.Surface): The window to draw on.
-        grid (list): The grid containing all the nodes.
-        rows (int): The number of rows and columns in the grid.
-        width (int): The width of the window.
+        grid (GridState): The grid containing all the nodes.
     """
-    win.fill(WHITE)
-    for row in grid:
-        for node in row:
-            node.draw(win)
-    draw_grid(win, rows, width)
-    pygame.display.update()
+    changed = np.flatnonzero(grid.color != grid.drawn)
+    dirty_rects = []
+    for idx in changed:
+        node = grid.nodes[idx]
+        node.draw(win)
+        rect = (node.x, node.y, node.width, node.width)
+        draw_grid(win, grid, rect)
+        dirty_rects.append(rect)
+    grid.drawn[changed] = grid.color[changed]
+    pygame.display.update(dirty_rects)
 
 
 def get_clicked_pos(pos, rows, width):
@@ -231,81 +364,510 @@ def get_clicked_pos(pos, rows, width):
     return row, col
 
 
-def reconstruct_path(came_from, current, draw):
+def reconstruct_path(grid, current, start_idx, draw):
     """
     Reconstructs the path from start to end node.
     Args:
-        came_from (dict): A dictionary mapping nodes to their predecessors.
-        current (Node): The current node.
+        grid (GridState): The grid holding the predecessor of each cell.
+        current (int): The cell id of the current node.
+        start_idx (int): The cell id of the start node, which is not recolored.
         draw (function): The function to draw the grid.
     """
-    while current in came_from:
+    came_from = grid.came_from
+    color = grid.color
+    step = 0
+    current = came_from[current]
+    while current != start_idx:
+        color[current] = PURPLE_ID
+        step += 1
+        if step % PATH_DRAW_EVERY == 0:
+            draw()
         current = came_from[current]
-        if not current.is_start():  # Do not recolor the start node
-            current.make_path()
+    draw()
+
+
+@njit(inline="always")
+def _heuristic(a, b, rows):
+    """
+    Manhattan distance between two cell ids.
+    """
+    return abs(a // rows - b // rows) + abs(a % rows - b % rows)
+
+
+@njit(inline="always")
+def _heap_less(heap_f, heap_g, heap_count, i, j):
+    """
+    Returns True if heap entry i is ordered before heap entry j.
+    Ties on f go to the higher g score, which is closer to the goal.
+    """
+    if heap_f[i] != heap_f[j]:
+        return heap_f[i] < heap_f[j]
+    if heap_g[i] != heap_g[j]:
+        return heap_g[i] > heap_g[j]
+    return heap_count[i] < heap_count[j]
+
+
+@njit(inline="always")
+def _heap_swap(heap_f, heap_g, heap_count, heap_idx, i, j):
+    """
+    Swaps heap entries i and j.
+    """
+    heap_f[i], heap_f[j] = heap_f[j], heap_f[i]
+    heap_g[i], heap_g[j] = heap_g[j], heap_g[i]
+    heap_count[i], heap_count[j] = heap_count[j], heap_count[i]
+    heap_idx[i], heap_idx[j] = heap_idx[j], heap_idx[i]
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_g, heap_count, heap_idx, size, f, g, count, idx):
+    """
+    Pushes an entry onto the binary heap and returns the new heap size.
+    """
+    i = size
+    heap_f[i] = f
+    heap_g[i] = g
+    heap_count[i] = count
+    heap_idx[i] = idx
+    while i > 0:
+        parent = (i - 1) // 2
+        if not _heap_less(heap_f, heap_g, heap_count, i, parent):
+            break
+        _heap_swap(heap_f, heap_g, heap_count, heap_idx, i, parent)
+        i = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_g, heap_count, heap_idx, size):
+    """
+    Removes the smallest entry from the binary heap and returns the new heap
+    size. The removed cell id must be read from heap_idx[0] beforehand.
+    """
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_g[0] = heap_g[size]
+    heap_count[0] = heap_count[size]
+    heap_idx[0] = heap_idx[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _heap_less(
+            heap_f, heap_g, heap_count, child + 1, child
+        ):
+            child += 1
+        if not _heap_less(heap_f, heap_g, heap_count, child, i):
+            break
+        _heap_swap(heap_f, heap_g, heap_count, heap_idx, i, child)
+        i = child
+    return size
+
+
+@njit(cache=True)
+def _astar_core(
+    color,
+    g,
+    f,
+    came_from,
+    neighbours,
+    barrier_bits,
+    in_open,
+    heap_f,
+    heap_g,
+    heap_count,
+    heap_idx,
+    state,
+    start_idx,
+    end_idx,
+    rows,
+    max_expansions,
+):
+    """
+    Expands at most max_expansions nodes of an A* search.
+    A cell whose score improves is pushed again, and heap entries of cells
+    that are no longer open are skipped.
+    The heap size and push counter are kept in state so the search can be
+    resumed by calling this function again.
+    Returns:
+        int: SEARCH_RUNNING, SEARCH_FOUND or SEARCH_FAILED.
+    """
+    size = state[0]
+    count = state[1]
+    status = SEARCH_RUNNING
+    one = np.uint64(1)
+
+    for _ in range(max_expansions):
+        if size == 0:
+            status = SEARCH_FAILED
+            break
+
+        current = heap_idx[0]
+        size = _heap_pop(heap_f, heap_g, heap_count, heap_idx, size)
+        if not in_open[current]:  # Outdated entry of an already expanded node
+            continue
+        in_open[current] = 0
+
+        if current == end_idx:
+            status = SEARCH_FOUND
+            break
+
+        temp_g_score = g[current] + 1
+        for k in range(4):
+            neighbour = neighbours[current, k]
+            if neighbour < 0:
+                continue
+            col = neighbour % rows
+            word = barrier_bits[neighbour // rows, col >> 6]
+            if (word >> np.uint64(col & 63)) & one:
+                continue
+
+            if temp_g_score < g[neighbour]:
+                came_from[neighbour] = current
+                g[neighbour] = temp_g_score
+                f[neighbour] = temp_g_score + _heuristic(neighbour, end_idx, rows)
+                count += 1
+                size = _heap_push(
+                    heap_f,
+                    heap_g,
+                    heap_count,
+                    heap_idx,
+                    size,
+                    f[neighbour],
+                    temp_g_score,
+                    count,
+                    neighbour,
+                )
+                in_open[neighbour] = 1
+                color[neighbour] = GREEN_ID
+
+        if current != start_idx:
+            color[current] = RED_ID
+
+    state[0] = size
+    state[1] = count
+    return status
+
+
+def _a_star_jit(draw, grid, start, end):
+    """
+    Runs the A* search through the JIT-compiled core, redrawing the grid
+    every DRAW_EVERY expansions.
+    Args:
+        draw (function): The function to draw the grid.
+        grid (GridState): The grid containing all the nodes.
+        start (Node): The start node.
+        end (Node): The end node.
+    Returns:
+        bool: True if a path is found, False otherwise.
+    """
+    n = grid.rows * grid.rows
+    # Every cell is expanded once and pushes at most its 4 neighbours
+    capacity = 4 * n + 1
+    heap_f = np.empty(capacity, np.int32)
+    heap_g = np.empty(capacity, np.int32)
+    heap_count = np.empty(capacity, np.int64)
+    heap_idx = np.empty(capacity, np.int32)
+    state = np.zeros(2, np.int64)
+
+    grid.reset_search()
+    grid.g[start.idx] = 0
+    grid.f[start.idx] = heuristic(start.get_pos(), end.get_pos())
+    state[0] = _heap_push(
+        heap_f, heap_g, heap_count, heap_idx, 0, grid.f[start.idx], 0, 0, start.idx
+    )
+    grid.in_open[start.idx] = 1
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                quit()
+
+        status = _astar_core(
+            grid.color,
+            grid.g,
+            grid.f,
+            grid.came_from,
+            grid.neighbours,
+            grid.barrier_bits,
+            grid.in_open,
+            heap_f,
+            heap_g,
+            heap_count,
+            heap_idx,
+            state,
+            start.idx,
+            end.idx,
+            grid.rows,
+            DRAW_EVERY,
+        )
+
+        if status == SEARCH_FOUND:
+            reconstruct_path(grid, end.idx, start.idx, draw)
+            end.make_end()
+            return True
+        if status == SEARCH_FAILED:
+            return False
+
         draw()
 
 
 def a_star_algorithm(draw, grid, start, end):
     """
     Runs the A* algorithm to find the shortest path.
+    The JIT-compiled search is used when numba is installed.
     Args:
         draw (function): The function to draw the grid.
-        grid (list): The grid containing all the nodes.
+        grid (GridState): The grid containing all the nodes.
         start (Node): The start node.
         end (Node): The end node.
     Returns:
         bool: True if a path is found, False otherwise.
     """
+    grid.update_barrier_bits()
+    if NUMBA_AVAILABLE:
+        return _a_star_jit(draw, grid, start, end)
+
+    rows = grid.rows
+    color = grid.color
+    g_score = grid.g
+    came_from = grid.came_from
+    in_open = grid.in_open
+    neighbours = grid.neighbours
+    barrier_rows = grid.barrier_rows()
+    start_idx = start.idx
+    end_idx = end.idx
+    end_row, end_col = end.row, end.col
+
+    grid.reset_search()
     count = 0
-    open_set = PriorityQueue()
-    open_set.put((0, count, start))
-    came_from = {}
-
-    g_score = {node: float("inf") for row in grid for node in row}
-    g_score[start] = 0
+    expansions = 0
+    # Entries are (f, -g, count, cell id), so ties on f favour deeper nodes
+    open_set = [(0, 0, count, start_idx)]
 
-    f_score = {node: float("inf") for row in grid for node in row}
-    f_score[start] = heuristic(start.get_pos(), end.get_pos())
+    g_score[start_idx] = 0
+    in_open[start_idx] = 1
 
-    open_set_hash = {start}
-
-    while not open_set.empty():
+    while open_set:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 quit()
 
-        current = open_set.get()[2]
-        open_set_hash.remove(current)
+        current = heapq.heappop(open_set)[3]
+        if not in_open[current]:  # Outdated entry of an already expanded node
+            continue
+        in_open[current] = 0
 
-        if current == end:
-            reconstruct_path(came_from, end, draw)
+        if current == end_idx:
+            reconstruct_path(grid, end_idx, start_idx, draw)
             end.make_end()
             return True
 
-        for neighbour in current.neighbours:
-            temp_g_score = g_score[current] + 1
+        temp_g_score = int(g_score[current]) + 1
+        for neighbour in neighbours[current].tolist():
+            if neighbour < 0:
+                continue
+            row, col = neighbour // rows, neighbour % rows
+            if (barrier_rows[row] >> col) & 1:
+                continue
 
             if temp_g_score < g_score[neighbour]:
                 came_from[neighbour] = current
                 g_score[neighbour] = temp_g_score
-                f_score[neighbour] = temp_g_score + heuristic(
-                    neighbour.get_pos(), end.get_pos()
+                f = temp_g_score + abs(row - end_row) + abs(col - end_col)
+                count += 1
+                heapq.heappush(open_set, (f, -temp_g_score, count, neighbour))
+                in_open[neighbour] = 1
+                color[neighbour] = GREEN_ID
+
+        expansions += 1
+        if expansions % DRAW_EVERY == 0:
+            draw()
+
+        if current != start_idx:
+            color[current] = RED_ID
+
+    return False
+
+
+def bidirectional_a_star(draw, grid, start, end):
+    """
+    Runs A* from the start and the end node at the same time, always
+    expanding the side with the lower f score, until the two searches meet.
+    Both sides use the balanced heuristic (h(n, target) - h(n, source)) / 2,
+    which lets the search stop as soon as the two lowest f scores add up to
+    the cost of the best path found. Scores are doubled to stay integers.
+    Args:
+        draw (function): The function to draw the grid.
+        grid (GridState): The grid containing all the nodes.
+        start (Node): The start node.
+        end (Node): The end node.
+    Returns:
+        bool: True if a path is found, False otherwise.
+    """
+    n = grid.rows * grid.rows
+    rows = grid.rows
+    color = grid.color
+    neighbours = grid.neighbours
+    grid.update_barrier_bits()
+    barrier_rows = grid.barrier_rows()
+    start_idx = start.idx
+    end_idx = end.idx
+
+    # The forward search uses the grid arrays so the path can be rebuilt
+    # with reconstruct_path, the backward search keeps its own arrays
+    grid.reset_search()
+    g_forward = grid.g
+    came_from_forward = grid.came_from
+    g_backward = np.full(n, INF_COST, np.int32)
+    came_from_backward = np.full(n, -1, np.int32)
+    closed_forward = np.zeros(n, np.uint8)
+    closed_backward = np.zeros(n, np.uint8)
+
+    count = 0
+    expansions = 0
+    g_forward[start_idx] = 0
+    g_backward[end_idx] = 0
+    f_start = heuristic(start.get_pos(), end.get_pos())
+    open_forward = [(f_start, 0, count, start_idx)]
+    open_backward = [(f_start, 0, count, end_idx)]
+
+    forward = (
+        open_forward,
+        g_forward,
+        came_from_forward,
+        closed_forward,
+        g_backward,
+        end.row,
+        end.col,
+        start.row,
+        start.col,
+    )
+    backward = (
+        open_backward,
+        g_backward,
+        came_from_backward,
+        closed_backward,
+        g_forward,
+        start.row,
+        start.col,
+        end.row,
+        end.col,
+    )
+
+    best_cost = INF_COST
+    meet = -1
+
+    while open_forward and open_backward:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                quit()
+
+        # No path through either frontier can beat the best meeting point
+        if open_forward[0][0] + open_backward[0][0] >= 2 * best_cost:
+            break
+
+        if open_forward[0][0] <= open_backward[0][0]:
+            side = forward
+        else:
+            side = backward
+        (
+            open_set,
+            g_score,
+            came_from,
+            closed,
+            g_other,
+            target_row,
+            target_col,
+            source_row,
+            source_col,
+        ) = side
+
+        current = heapq.heappop(open_set)[3]
+        if closed[current]:  # Outdated entry of an already expanded node
+            continue
+        closed[current] = 1
+
+        temp_g_score = int(g_score[current]) + 1
+        for neighbour in neighbours[current].tolist():
+            if neighbour < 0:
+                continue
+            row, col = neighbour // rows, neighbour % rows
+            if (barrier_rows[row] >> col) & 1:
+                continue
+
+            if temp_g_score < g_score[neighbour]:
+                came_from[neighbour] = current
+                g_score[neighbour] = temp_g_score
+                f_score = (
+                    2 * temp_g_score
+                    + abs(row - target_row)
+                    + abs(col - target_col)
+                    - abs(row - source_row)
+                    - abs(col - source_col)
                 )
+                count += 1
+                heapq.heappush(open_set, (f_score, -temp_g_score, count, neighbour))
+                color[neighbour] = GREEN_ID
 
-                if neighbour not in open_set_hash:
-                    count += 1
-                    open_set.put((f_score[neighbour], count, neighbour))
-                    open_set_hash.add(neighbour)
-                    neighbour.make_open()
+                if temp_g_score + g_other[neighbour] < best_cost:
+                    best_cost = temp_g_score + g_other[neighbour]
+                    meet = neighbour
 
-        draw()
+        expansions += 1
+        if expansions % DRAW_EVERY == 0:
+            draw()
 
-        if current != start:
-            current.make_closed()
+        if current != start_idx and current != end_idx:
+            color[current] = RED_ID
 
-    return False
+    start.make_start()
+    end.make_end()
+    if meet < 0:
+        return False
+
+    # Link the backward chain into came_from so it leads from the end,
+    # through the meeting point, back to the start
+    current = meet
+    while current != end_idx:
+        following = came_from_backward[current]
+        came_from_forward[following] = current
+        current = following
+
+    reconstruct_path(grid, end_idx, start_idx, draw)
+    return True
+
+
+# Fonts and static text are rendered once and reused every frame
+pygame.font.init()
+FONT36 = pygame.font.Font(None, 36)
+
+INSTRUCTIONS = [
+    "Instructions:",
+    "1. Left-click to add the start node (PINK).",
+    "2. Left-click again to add the end node (BLUE).",
+    "3. After adding start and end nodes, left-click to add barriers (Black).",
+    "4. Right-click to remove a node.",
+    "5. Click 'Space' to start the algorithm.",
+    "6. Press 'B' to toggle bidirectional search.",
+    "",
+    "Press 'Start' to begin!",
+]
+TITLE_SURF = FONT36.render("Welcome to A* Pathfinder Algorithm", True, BLACK)
+INSTR_SURFS = [FONT36.render(line, True, BLACK) for line in INSTRUCTIONS]
+
+START_SURF = FONT36.render("Start", True, BLACK)
+START_RECT = START_SURF.get_rect(center=(WIDTH // 2, 600))
+START_BUTTON = START_RECT.inflate(20, 20)
+RESTART_SURF = FONT36.render("Restart", True, BLACK)
+RESTART_RECT = RESTART_SURF.get_rect(center=(WIDTH // 2 - 100, 600))
+RESTART_BUTTON = RESTART_RECT.inflate(20, 20)
+QUIT_SURF = FONT36.render("Quit", True, BLACK)
+QUIT_RECT = QUIT_SURF.get_rect(center=(WIDTH // 2 + 100, 600))
+QUIT_BUTTON = QUIT_RECT.inflate(20, 20)
 
 
 def instructions_page():
@@ -313,26 +875,10 @@ def instructions_page():
     Displays the instructions page.
     """
     WIN.fill(WHITE)
-    pygame.font.init()
-    font = pygame.font.Font(None, 36)
-    text = font.render("Welcome to A* Pathfinder Algorithm", True, BLACK)
-    text_rect = text.get_rect(center=(WIDTH // 2, 100))
-    WIN.blit(text, text_rect)
-
-    instructions = [
-        "Instructions:",
-        "1. Left-click to add the start node (PINK).",
-        "2. Left-click again to add the end node (BLUE).",
-        "3. After adding start and end nodes, left-click to add barriers (Black).",
-        "4. Right-click to remove a node.",
-        "5. Click 'Space' to start the algorithm.",
-        "",
-        "Press 'Start' to begin!",
-    ]
+    WIN.blit(TITLE_SURF, TITLE_SURF.get_rect(center=(WIDTH // 2, 100)))
 
     y_offset = 200
-    for instruction in instructions:
-        text = font.render(instruction, True, BLACK)
+    for text in INSTR_SURFS:
         text_rect = text.get_rect(center=(WIDTH // 2, y_offset))
         WIN.blit(text, text_rect)
         y_offset += 40
@@ -344,21 +890,8 @@ def draw_start_button():
     """
     Draws the start button.
     """
-    pygame.font.init()
-    font = pygame.font.Font(None, 36)
-    text = font.render("Start", True, BLACK)
-    text_rect = text.get_rect(center=(WIDTH // 2, 600))
-    pygame.draw.rect(
-        WIN,
-        GREEN,
-        (
-            text_rect.x - 10,
-            text_rect.y - 10,
-            text_rect.width + 20,
-            text_rect.height + 20,
-        ),
-    )
-    WIN.blit(text, text_rect)
+    pygame.draw.rect(WIN, GREEN, START_BUTTON)
+    WIN.blit(START_SURF, START_RECT)
     pygame.display.update()
 
 
@@ -366,36 +899,12 @@ def draw_restart_quit_buttons():
     """
     Draws the restart and quit buttons.
     """
-    pygame.font.init()
-    font = pygame.font.Font(None, 36)
-    restart_text = font.render("Restart", True, BLACK)
-    restart_rect = restart_text.get_rect(center=(WIDTH // 2 - 100, 600))
-    pygame.draw.rect(
-        WIN,
-        GREEN,
-        (
-            restart_rect.x - 10,
-            restart_rect.y - 10,
-            restart_rect.width + 20,
-            restart_rect.height + 20,
-        ),
-    )
-    WIN.blit(restart_text, restart_rect)
+    pygame.draw.rect(WIN, GREEN, RESTART_BUTTON)
+    WIN.blit(RESTART_SURF, RESTART_RECT)
 
-    quit_text = font.render("Quit", True, BLACK)
-    quit_rect = quit_text.get_rect(center=(WIDTH // 2 + 100, 600))
-    pygame.draw.rect(
-        WIN,
-        RED,
-        (
-            quit_rect.x - 10,
-            quit_rect.y - 10,
-            quit_rect.width + 20,
-            quit_rect.height + 20,
-        ),
-    )
-    WIN.blit(quit_text, quit_rect)
-    pygame.display.update()
+    pygame.draw.rect(WIN, RED, QUIT_BUTTON)
+    WIN.blit(QUIT_SURF, QUIT_RECT)
+    pygame.display.update((RESTART_BUTTON, QUIT_BUTTON))
 
 
 def main(win, width):
@@ -405,7 +914,7 @@ def main(win, width):
         win (pygame.Surface): The window to draw on.
         width (int): The width of the window.
     """
-    rows = 50
+    rows = ROWS
     grid = create_grid(rows, width)
 
     start_node = None
@@ -414,23 +923,32 @@ def main(win, width):
     run = True
     started = False
     path_found = False
+    bidirectional = False
 
     while run:
-        draw(win, grid, rows, width)
+        draw(win, grid)
         if path_found:
             draw_restart_quit_buttons()
 
-        for event in pygame.event.get():
+        # Read the mouse once per frame, after the event queue is pumped
+        events = pygame.event.get()
+        mouse_buttons = pygame.mouse.get_pressed()
+        mouse_pos = pygame.mouse.get_pos()
+        clicked_row, clicked_col = get_clicked_pos(mouse_pos, rows, width)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 run = False
 
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window contents may have been lost, repaint all of it
+                grid.invalidate()
+
             if started and not path_found:
                 continue
 
-            if pygame.mouse.get_pressed()[0]:  # LEFT CLICK
-                pos = pygame.mouse.get_pos()
-                row, col = get_clicked_pos(pos, rows, width)
-                node = grid[row][col]
+            if mouse_buttons[0]:  # LEFT CLICK
+                node = grid.node(clicked_row, clicked_col)
                 if not start_node and node != end_node:
                     start_node = node
                     start_node.make_start()
@@ -442,10 +960,8 @@ def main(win, width):
                 elif node != end_node and node != start_node:
                     node.make_barrier()
 
-            elif pygame.mouse.get_pressed()[2]:  # RIGHT CLICK
-                pos = pygame.mouse.get_pos()
-                row, col = get_clicked_pos(pos, rows, width)
-                node = grid[row][col]
+            elif mouse_buttons[2]:  # RIGHT CLICK
+                node = grid.node(clicked_row, clicked_col)
                 node.reset()
                 if node == start_node:
                     start_node = None
@@ -454,15 +970,23 @@ def main(win, width):
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE and start_node and end_node:
-                    for row in grid:
-                        for node in row:
-                            node.update_neighbours(grid)
-
-                    path_found = a_star_algorithm(
-                        lambda: draw(win, grid, rows, width), grid, start_node, end_node
+                    if path_found:
+                        # Paint over the restart and quit buttons
+                        grid.invalidate()
+                    search = bidirectional_a_star if bidirectional else a_star_algorithm
+                    path_found = search(
+                        lambda: draw(win, grid), grid, start_node, end_node
                     )
                     started = True
 
+                if event.key == pygame.K_b:
+                    bidirectional = not bidirectional
+                    pygame.display.set_caption(
+                        "Bidirectional A* Pathfinder Algorithm"
+                        if bidirectional
+                        else "A* Pathfinder Algorithm"
+                    )
+
                 if event.key == pygame.K_r:
                     start_node = None
                     end_node = None
@@ -473,15 +997,14 @@ def main(win, width):
             if path_found:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
-                        pos = pygame.mouse.get_pos()
-                        if 240 <= pos[0] <= 360 and 570 <= pos[1] <= 630:
+                        if RESTART_BUTTON.collidepoint(mouse_pos):
                             # Restart button clicked
                             start_node = None
                             end_node = None
                             grid = create_grid(rows, width)
                             started = False
                             path_found = False
-                        elif 440 <= pos[0] <= 560 and 570 <= pos[1] <= 630:
+                        elif QUIT_BUTTON.collidepoint(mouse_pos):
                             # Quit button clicked
                             run = False
 
@@ -505,8 +1028,7 @@ def display_instructions_and_start():
                 return False
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    pos = pygame.mouse.get_pos()
-                    if 350 <= pos[0] <= 450 and 570 <= pos[1] <= 630:
+                    if START_BUTTON.collidepoint(event.pos):
                         start_button_clicked = True
                         return True
 